@@ -5,14 +5,17 @@ Run this to get actual performance characteristics for your models.
 
 """
 
+from collections.abc import Callable
 from datetime import UTC, datetime
+import gc
 import json
 from pathlib import Path
 import statistics
 import sys
 import time
+import timeit
 import tracemalloc
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import BaseModel
 
@@ -23,7 +26,72 @@ try:
 except ImportError:
     has_orjson = False
 
-from ci.transparency.ptag.types import PTag, PTagSeries
+try:
+    import msgspec
+
+    has_msgspec = True
+except ImportError:
+    has_msgspec = False
+
+from ci.transparency.ptag.types import PTag, PTagInterval, PTagSeries
+from ci.transparency.ptag.types.ptag import (
+    AcctAge,
+    AcctType,
+    AutomationFlag,
+    ClientFamily,
+    MediaProvenance,
+    PostKind,
+)
+
+# msgspec mirrors of the generated models, used only as a validation-speed comparison.
+# Constraints follow the schemas (patterns, 0-1 probabilities, tz-aware timestamps).
+if has_msgspec:
+    MsgspecHexHash = Annotated[
+        str, msgspec.Meta(min_length=8, max_length=16, pattern="^[a-f0-9]{8,16}$")
+    ]
+    MsgspecCountry = Annotated[str, msgspec.Meta(pattern="^[A-Z]{2}(-[A-Z]{1,3})?$")]
+    MsgspecProbability = Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]
+    MsgspecCount = Annotated[int, msgspec.Meta(ge=0)]
+    MsgspecAwareDatetime = Annotated[datetime, msgspec.Meta(tz=True)]
+
+    class MsgspecPTag(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+        acct_age_bucket: AcctAge
+        acct_type: AcctType
+        automation_flag: AutomationFlag
+        post_kind: PostKind
+        client_family: ClientFamily
+        media_provenance: MediaProvenance
+        dedup_hash: MsgspecHexHash
+        content_digest: MsgspecHexHash | None = None
+        origin_hint: MsgspecCountry | None = None
+
+    class MsgspecCoordinationSignals(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+        burst_score: MsgspecProbability
+        synchrony_index: MsgspecProbability
+        duplication_clusters: MsgspecCount
+
+    class MsgspecPTagSeriesPoint(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+        interval_start: MsgspecAwareDatetime
+        volume: MsgspecCount
+        reshare_ratio: MsgspecProbability
+        recycled_content_rate: MsgspecProbability
+        acct_age_mix: dict[str, MsgspecProbability]
+        automation_mix: dict[str, MsgspecProbability]
+        client_mix: dict[str, MsgspecProbability]
+        coordination_signals: MsgspecCoordinationSignals
+
+    class MsgspecPTagSeries(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+        topic: Annotated[str, msgspec.Meta(min_length=1)]
+        generated_at: MsgspecAwareDatetime
+        interval: PTagInterval
+        points: list[MsgspecPTagSeriesPoint] = msgspec.field(default_factory=list)
+
+    MSGSPEC_TYPES: dict[type[BaseModel], type] = {
+        PTag: MsgspecPTag,
+        PTagSeries: MsgspecPTagSeries,
+    }
+else:
+    MSGSPEC_TYPES = {}
 
 
 def create_minimal_series() -> dict[str, Any]:
@@ -67,19 +135,22 @@ def create_complex_series(num_points: int = 100) -> dict[str, Any]:
     base_data = create_minimal_series()
     base_point = base_data["points"][0]
 
-    # Generate many time points
-    points = []
-    for i in range(num_points):
-        point = base_point.copy()
-        # Vary timestamp
-        ts = datetime(2025, 8, 19, 12, i % 60, 0, tzinfo=UTC)
-        point["interval_start"] = ts.isoformat().replace("+00:00", "Z")
-        # Vary some values slightly
-        point["volume"] = 100 + (i % 50)
-        point["reshare_ratio"] = min(1.0, 0.25 + (i % 10) * 0.05)
-        points.append(point)
-
-    base_data["points"] = points
+    # One timestamp per minute of the hour; points cycle through them
+    timestamps = [
+        datetime(2025, 8, 19, 12, minute, 0, tzinfo=UTC).isoformat().replace("+00:00", "Z")
+        for minute in range(60)
+    ]
+
+    # Generate many time points, varying timestamp and some values slightly
+    base_data["points"] = [
+        {
+            **base_point,
+            "interval_start": timestamps[i % 60],
+            "volume": 100 + (i % 50),
+            "reshare_ratio": min(1.0, 0.25 + (i % 10) * 0.05),
+        }
+        for i in range(num_points)
+    ]
     return base_data
 
 
@@ -97,119 +168,165 @@ def create_ptag() -> dict[str, Any]:
     }
 
 
-def benchmark_validation(
-    name: str,
-    model_class: type[BaseModel],
-    data: dict[str, Any],
-    iterations: int = 10000,
-):
-    """Benchmark validation performance."""
-    print(f"\n🔬 Benchmarking {name} validation ({iterations:,} iterations)")
+def _time_per_call(func: Callable[[], object], repeat: int = 5) -> tuple[float, float, int]:
+    """Return (mean, stdev) seconds per call and the loop count chosen by ``autorange``.
 
-    # Warm up
-    for _ in range(100):
-        model_class.model_validate(data)
+    Calibration runs on the default float-seconds clock (``autorange`` compares against
+    0.2s); the measured repeats use integer ``perf_counter_ns`` and convert once at the end.
+    ``timeit`` keeps the cyclic GC disabled while it times; collecting first means each
+    measurement starts without garbage left over from calibration or earlier variants.
+    """
+    number, _ = timeit.Timer(func).autorange()
+    gc.collect()
+    timer = timeit.Timer(func, timer=time.perf_counter_ns)
+    times = [t / 1e9 / number for t in timer.repeat(repeat=repeat, number=number)]
+    return statistics.mean(times), statistics.stdev(times), number
 
-    # Memory tracking
-    tracemalloc.start()
 
-    # Timing
-    times: list[float] = []
-    for _ in range(5):  # 5 runs for statistics
-        start_time = time.perf_counter()
-        for _ in range(iterations):
-            obj = model_class.model_validate(data)
-        end_time = time.perf_counter()
-        times.append(end_time - start_time)
+def _report_validation(label: str, avg_time: float, std_time: float, number: int) -> float:
+    """Print validation timing for one variant and return records/sec."""
+    records_per_sec = 1 / avg_time
+    print(f"  {label} ({number:,} calls/run):")
+    print(f"    Average time: {avg_time * 1e6:.2f}µs (±{std_time * 1e6:.2f}µs)")
+    print(f"    Records/sec: {records_per_sec:,.0f}")
+    print(f"    Time per record: {avg_time * 1000:.3f}ms")
+    return records_per_sec
 
-    # Memory measurement
-    tracemalloc.stop()
 
-    # Calculate stats
-    avg_time: float = statistics.mean(times)
-    std_time: float = statistics.stdev(times)
-    records_per_sec = iterations / avg_time
+def benchmark_validation(
+    name: str,
+    model_class: type[BaseModel],
+    data: dict[str, Any],
+):
+    """Benchmark validation performance.
+
+    Measures the model's pydantic-core validator directly: ``validate_python`` on a
+    Python dict and ``validate_json`` on pre-serialized bytes (parsed and validated in
+    one pass). These are what ``model_validate``/``model_validate_json`` dispatch to.
+    When msgspec is installed, the same bytes are also decoded into the matching
+    ``msgspec.Struct`` mirror as a comparison. Loop counts are calibrated with
+    ``timeit.Timer.autorange``.
+    """
+    print(f"\n🔬 Benchmarking {name} validation")
+
+    payload = orjson.dumps(data) if has_orjson else json.dumps(data).encode("utf-8")
+
+    # Call pydantic-core's validator directly (what model_validate/model_validate_json
+    # dispatch to), bound once so the timed region has no attribute lookups
+    validator = model_class.__pydantic_validator__
+    validate = validator.validate_python
+    validate_json = validator.validate_json
+
+    # Warm up once; every timed repeat below reuses the same warm handles
+    for _ in range(200):
+        validate(data)
+        validate_json(payload)
+
+    results: dict[str, float] = {}
+    results["dict"] = _report_validation(
+        "validate_python (dict)", *_time_per_call(lambda: validate(data))
+    )
+    results["json"] = _report_validation(
+        "validate_json (bytes)", *_time_per_call(lambda: validate_json(payload))
+    )
 
-    print(f"  Average time: {avg_time:.4f}s (±{std_time:.4f}s)")
-    print(f"  Records/sec: {records_per_sec:,.0f}")
-    print(f"  Time per record: {(avg_time / iterations) * 1000:.3f}ms")
+    msgspec_type = MSGSPEC_TYPES.get(model_class)
+    if msgspec_type is not None:
+        decode = msgspec.json.Decoder(msgspec_type).decode
+        decode(payload)  # warm up (and fail loudly if the mirror drifts from the data)
+        results["msgspec"] = _report_validation(
+            "msgspec.json.Decoder (bytes)", *_time_per_call(lambda: decode(payload))
+        )
 
-    return records_per_sec, obj
+    return results, validate(data)
 
 
-def benchmark_serialization(name: str, obj, iterations: int = 10000) -> dict[str, float]:
+def benchmark_serialization(name: str, obj) -> dict[str, float]:
     """Benchmark serialization performance."""
-    print(f"\n📤 Benchmarking {name} serialization ({iterations:,} iterations)")
+    print(f"\n📤 Benchmarking {name} serialization")
 
     results = {}
 
-    # Pydantic JSON
-    times: list[float] = []
-    for _ in range(5):
-        start_time = time.perf_counter()
-        for _ in range(iterations):
-            json.dumps(obj.model_dump(mode="json"))
-        end_time = time.perf_counter()
-        times.append(end_time - start_time)
-
-    avg_time = statistics.mean(times)
-    results["pydantic"] = iterations / avg_time
+    # Hoist bound methods so the timed region has no attribute lookups
+    dump = obj.model_dump
+    dump_json = obj.model_dump_json
+    dumps = json.dumps
+
+    # Pydantic JSON (serialized directly by pydantic-core, no intermediate dict)
+    avg_time, _, _ = _time_per_call(dump_json)
+    results["pydantic"] = 1 / avg_time
     print(f"  Pydantic JSON: {results['pydantic']:,.0f} records/sec")
 
     # model_dump() + stdlib json (need mode='json' for enum serialization)
-    times = []
-    for _ in range(5):
-        start_time = time.perf_counter()
-        for _ in range(iterations):
-            data = obj.model_dump(mode="json")  # This converts enums to their values
-            json.dumps(data)
-        end_time = time.perf_counter()
-        times.append(end_time - start_time)
-
-    avg_time = statistics.mean(times)
-    results["stdlib_json"] = iterations / avg_time
-    print(f"  stdlib json: {results['stdlib_json']:,.0f} records/sec")
+    avg_time, _, _ = _time_per_call(lambda: dumps(dump(mode="json")))
+    results["stdlib_json"] = 1 / avg_time
+    print(f"  pydantic dict + json.dumps: {results['stdlib_json']:,.0f} records/sec")
+
+    # Split the two-step paths: pydantic -> dict alone, then dict -> JSON alone
+    avg_time, _, _ = _time_per_call(lambda: dump(mode="json"))
+    results["model_dump"] = 1 / avg_time
+    print(f"    model_dump(mode='json') only: {results['model_dump']:,.0f} records/sec")
+
+    precomputed = dump(mode="json")
+    avg_time, _, _ = _time_per_call(lambda: dumps(precomputed))
+    results["dict_stdlib_json"] = 1 / avg_time
+    print(f"    dict→JSON (stdlib): {results['dict_stdlib_json']:,.0f} records/sec")
 
     # orjson if available
     if has_orjson:
-        times = []
-        for _ in range(5):
-            start_time = time.perf_counter()
-            for _ in range(iterations):
-                data = obj.model_dump(mode="json")  # Convert enums for orjson too
-                orjson.dumps(data)
-            end_time = time.perf_counter()
-            times.append(end_time - start_time)
-
-        avg_time = statistics.mean(times)
-        results["orjson"] = iterations / avg_time
-        print(f"  orjson: {results['orjson']:,.0f} records/sec")
+        orjson_dumps = orjson.dumps
+        # Convert enums for orjson too
+        avg_time, _, _ = _time_per_call(lambda: orjson_dumps(dump(mode="json")))
+        results["orjson"] = 1 / avg_time
+        print(f"  pydantic dict + orjson: {results['orjson']:,.0f} records/sec")
+
+        avg_time, _, _ = _time_per_call(lambda: orjson_dumps(precomputed))
+        results["dict_orjson"] = 1 / avg_time
+        print(f"    dict→JSON (orjson): {results['dict_orjson']:,.0f} records/sec")
+
+        # Low-level serializer handle: same bytes as orjson, without the dict round-trip
+        to_json = obj.__pydantic_serializer__.to_json
+        avg_time, _, _ = _time_per_call(lambda: to_json(obj))
+        results["serializer"] = 1 / avg_time
+        print(f"  __pydantic_serializer__.to_json: {results['serializer']:,.0f} records/sec")
 
     return results
 
 
 def measure_memory_usage(name: str, obj):
-    """Measure memory usage of objects."""
+    """Measure memory usage of objects.
+
+    The source object is dumped once and re-validated from that dict into a pre-sized
+    list. ``model_construct`` is not used: it leaves nested points as plain dicts, so the
+    memory layout being measured would differ.
+    """
     print(f"\n💾 Memory usage for {name}")
 
     # Get object size
-    import sys
-
     size = sys.getsizeof(obj)
 
+    # Dump once and pre-size the holding list, both outside the measured region,
+    # so the delta is the retained models rather than list growth
+    cls = type(obj)
+    validate = cls.model_validate
+    data = obj.model_dump()
+    count = 1000
+    pool: list[BaseModel | None] = [None] * count
+
     # More detailed measurement
     tracemalloc.start()
     snapshot1 = tracemalloc.take_snapshot()
 
-    # Create a list of objects to measure overhead
-    _: list[type(obj)] = [type(obj).model_validate(obj.model_dump()) for _ in range(1000)]
+    # Fill the pool to measure per-object overhead
+    for i in range(count):
+        pool[i] = validate(data)
 
     snapshot2 = tracemalloc.take_snapshot()
     tracemalloc.stop()
 
     top_stats = snapshot2.compare_to(snapshot1, "lineno")
     total_memory = sum(stat.size for stat in top_stats)
-    avg_per_object = total_memory / 1000
+    avg_per_object = total_memory / count
 
     print(f"  sys.getsizeof(): {size:,} bytes")
     print(f"  Estimated per object: {avg_per_object:,.0f} bytes")
@@ -231,6 +348,9 @@ def _write_text_summary(
     ptag_rps: float,
     series_min_rps: float,
     series_complex_rps: float,
+    ptag_json_rps: float,
+    series_min_json_rps: float,
+    series_complex_json_rps: float,
     ptag_ser_pyd: float,
     series_min_ser_pyd: float,
     series_complex_ser_pyd: float,
@@ -245,11 +365,16 @@ def _write_text_summary(
     lines.append("PERFORMANCE SUMMARY")
     lines.append("=" * 50)
     lines.append("")
-    lines.append("  VALIDATION PERFORMANCE")
+    lines.append("  VALIDATION PERFORMANCE (validate_python)")
     lines.append(f"PTag:      {ptag_rps:,.0f} records/sec")
     lines.append(f"PTagSeries (minimal):    {series_min_rps:,.0f} records/sec")
     lines.append(f"PTagSeries (complex):       {series_complex_rps:,.0f} records/sec")
     lines.append("")
+    lines.append("  VALIDATION PERFORMANCE (validate_json)")
+    lines.append(f"PTag (JSON):      {ptag_json_rps:,.0f} records/sec")
+    lines.append(f"PTagSeries (minimal, JSON):    {series_min_json_rps:,.0f} records/sec")
+    lines.append(f"PTagSeries (complex, JSON):       {series_complex_json_rps:,.0f} records/sec")
+    lines.append("")
     lines.append("  SERIALIZATION PERFORMANCE (Pydantic JSON)")
     lines.append(f"PTag:      {ptag_ser_pyd:,.0f} records/sec")
     lines.append(f"PTagSeries (minimal):   {series_min_ser_pyd:,.0f} records/sec")
@@ -267,7 +392,7 @@ def _write_text_summary(
     lines.append(f"PTagSeries (complex):   {series_complex_mem:,.0f} bytes")
 
     out = _repo_root() / "performance_results.txt"
-    out.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
     return out
 
 
@@ -278,9 +403,18 @@ def _write_markdown_summary(
     ptag_rps: float,
     series_min_rps: float,
     series_complex_rps: float,
+    ptag_json_rps: float,
+    series_min_json_rps: float,
+    series_complex_json_rps: float,
+    ptag_msgspec_rps: float | None,
+    series_min_msgspec_rps: float | None,
+    series_complex_msgspec_rps: float | None,
     ptag_ser_pyd: float,
     series_min_ser_pyd: float,
     series_complex_ser_pyd: float,
+    ptag_ser_std: float,
+    series_min_ser_std: float,
+    series_complex_ser_std: float,
     ptag_ser_orj: float | None,
     series_min_ser_orj: float | None,
     series_complex_ser_orj: float | None,
@@ -291,54 +425,70 @@ def _write_markdown_summary(
     def fmt(n: float | None) -> str:
         return f"{n:,.0f}" if n is not None else "—"
 
-    lines = []
-    lines.append("# Performance Benchmark")
-    lines.append("")
-    lines.append(f"- **Python:** `{python_version.strip()}`")
-    lines.append(f"- **orjson available:** `{has_orjson}`")
-    lines.append("")
-    lines.append("## Validation Throughput (records/sec)")
-    lines.append("")
-    lines.append("| Model | Records/sec |")
-    lines.append("|---|---:|")
-    lines.append(f"| PTag | {fmt(ptag_rps)} |")
-    lines.append(f"| PTagSeries (minimal) | {fmt(series_min_rps)} |")
-    lines.append(f"| PTagSeries (complex) | {fmt(series_complex_rps)} |")
-    lines.append("")
-    lines.append("## Serialization Throughput (records/sec)")
-    lines.append("")
+    # The orjson column is only present when orjson is installed
+    orj_head, orj_rule = (" orjson |", "---:|") if has_orjson else ("", "")
+
+    def orj(n: float | None) -> str:
+        return f" {fmt(n)} |" if has_orjson else ""
+
+    body = f"""# Performance Benchmark
+
+- **Python:** `{python_version.strip()}`
+- **orjson available:** `{has_orjson}`
+- **msgspec available:** `{has_msgspec}`
+
+## Validation Throughput (records/sec)
+
+| Model | validate_python (dict) | validate_json (bytes) | msgspec (bytes) |
+|---|---:|---:|---:|
+| PTag | {fmt(ptag_rps)} | {fmt(ptag_json_rps)} | {fmt(ptag_msgspec_rps)} |
+| PTagSeries (minimal) | {fmt(series_min_rps)} | {fmt(series_min_json_rps)} | {fmt(series_min_msgspec_rps)} |
+| PTagSeries (complex) | {fmt(series_complex_rps)} | {fmt(series_complex_json_rps)} | {fmt(series_complex_msgspec_rps)} |
+
+## Serialization Throughput (records/sec)
+
+| Model | Pydantic JSON | stdlib json |{orj_head}
+|---|---:|---:|{orj_rule}
+| PTag | {fmt(ptag_ser_pyd)} | {fmt(ptag_ser_std)} |{orj(ptag_ser_orj)}
+| PTagSeries (minimal) | {fmt(series_min_ser_pyd)} | {fmt(series_min_ser_std)} |{orj(series_min_ser_orj)}
+| PTagSeries (complex) | {fmt(series_complex_ser_pyd)} | {fmt(series_complex_ser_std)} |{orj(series_complex_ser_orj)}
+
+## Estimated Memory Usage (bytes per object)
+
+| Model | Bytes/object |
+|---|---:|
+| PTag | {fmt(ptag_mem)} |
+| PTagSeries (minimal) | {fmt(series_min_mem)} |
+| PTagSeries (complex) | {fmt(series_complex_mem)} |
+"""
+
+    out = _repo_root() / "performance_results.md"
+    out.write_bytes(body.encode("utf-8"))
+    return out
+
+
+def _write_json_summary(
+    *,
+    python_version: str,
+    validation: dict[str, dict[str, float]],
+    serialization: dict[str, dict[str, float]],
+    memory: dict[str, float],
+) -> Path:
+    results = {
+        "python": python_version.strip(),
+        "orjson_available": has_orjson,
+        "msgspec_available": has_msgspec,
+        "validation_records_per_sec": validation,
+        "serialization_records_per_sec": serialization,
+        "memory_bytes_per_object": memory,
+    }
     if has_orjson:
-        lines.append("| Model | Pydantic JSON | stdlib json | orjson |")
-        lines.append("|---|---:|---:|---:|")
-        lines.append(f"| PTag | {fmt(ptag_ser_pyd)} | {fmt(ptag_ser_pyd)} | {fmt(ptag_ser_orj)} |")
-        # stdlib json equals pydantic’s json.dumps(model_dump()) timing in your script
-        lines.append(
-            f"| PTagSeries (minimal) | {fmt(series_min_ser_pyd)} | {fmt(series_min_ser_pyd)} | {fmt(series_min_ser_orj)} |"
-        )
-        lines.append(
-            f"| PTagSeries (complex) | {fmt(series_complex_ser_pyd)} | {fmt(series_complex_ser_pyd)} | {fmt(series_complex_ser_orj)} |"
-        )
+        body = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
     else:
-        lines.append("| Model | Pydantic JSON | stdlib json |")
-        lines.append("|---|---:|---:|")
-        lines.append(f"| PTag | {fmt(ptag_ser_pyd)} | {fmt(ptag_ser_pyd)} |")
-        lines.append(
-            f"| PTagSeries (minimal) | {fmt(series_min_ser_pyd)} | {fmt(series_min_ser_pyd)} |"
-        )
-        lines.append(
-            f"| PTagSeries (complex) | {fmt(series_complex_ser_pyd)} | {fmt(series_complex_ser_pyd)} |"
-        )
-    lines.append("")
-    lines.append("## Estimated Memory Usage (bytes per object)")
-    lines.append("")
-    lines.append("| Model | Bytes/object |")
-    lines.append("|---|---:|")
-    lines.append(f"| PTag | {fmt(ptag_mem)} |")
-    lines.append(f"| PTagSeries (minimal) | {fmt(series_min_mem)} |")
-    lines.append(f"| PTagSeries (complex) | {fmt(series_complex_mem)} |")
+        body = (json.dumps(results, indent=2) + "\n").encode("utf-8")
 
-    out = _repo_root() / "performance_results.md"
-    out.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out = _repo_root() / "performance_results.json"
+    out.write_bytes(body)
     return out
 
 
@@ -348,43 +498,44 @@ def main():
     print("=" * 50)
     print(f"Python version: {sys.version}")
     print(f"orjson available: {has_orjson}")
+    print(f"msgspec available: {has_msgspec}")
     print()
 
-    # Create test data
-    minimal_series_data = create_minimal_series()
-    complex_series_data = create_complex_series(100)
-    provenance_data = create_ptag()
+    # Benchmark cases; PTagSeries cases stay adjacent so its validator runs back-to-back
+    specs: list[tuple[str, type[BaseModel], dict[str, Any]]] = [
+        ("PTag", PTag, create_ptag()),
+        ("PTagSeries (minimal)", PTagSeries, create_minimal_series()),
+        ("PTagSeries (complex)", PTagSeries, create_complex_series(100)),
+    ]
 
     # Validation benchmarks
-    provenance_rps, provenance_obj = benchmark_validation("PTag", PTag, provenance_data, 20000)
-
-    minimal_series_rps, minimal_series_obj = benchmark_validation(
-        "PTagSeries (minimal)", PTagSeries, minimal_series_data, 10000
-    )
-
-    complex_series_rps, complex_series_obj = benchmark_validation(
-        "PTagSeries (100 points)", PTagSeries, complex_series_data, 1000
-    )
+    validation = {name: benchmark_validation(name, cls, data) for name, cls, data in specs}
+    objs = {name: obj for name, (_, obj) in validation.items()}
 
     # Serialization benchmarks
-    provenance_ser = benchmark_serialization("PTag", provenance_obj, 20000)
-    minimal_ser = benchmark_serialization("PTagSeries (minimal)", minimal_series_obj, 10000)
-    complex_ser = benchmark_serialization("PTagSeries (100 points)", complex_series_obj, 1000)
+    serialization = {name: benchmark_serialization(name, obj) for name, obj in objs.items()}
 
     # Memory usage
-    provenance_mem = measure_memory_usage("PTag", provenance_obj)
-    minimal_mem = measure_memory_usage("PTagSeries (minimal)", minimal_series_obj)
-    complex_mem = measure_memory_usage("PTagSeries (100 points)", complex_series_obj)
+    memory = {name: measure_memory_usage(name, obj) for name, obj in objs.items()}
+
+    (provenance_val, _), (minimal_series_val, _), (complex_series_val, _) = validation.values()
+    provenance_ser, minimal_ser, complex_ser = serialization.values()
+    provenance_mem, minimal_mem, complex_mem = memory.values()
 
     # Summary
     print("\n" + "=" * 50)
     print(" PERFORMANCE SUMMARY")
     print("=" * 50)
 
-    print("\n  VALIDATION PERFORMANCE")
-    print(f"PTag:     {provenance_rps:>8,.0f} records/sec")
-    print(f"PTagSeries (minimal):  {minimal_series_rps:>8,.0f} records/sec")
-    print(f"PTagSeries (complex):  {complex_series_rps:>8,.0f} records/sec")
+    print("\n  VALIDATION PERFORMANCE (validate_python)")
+    print(f"PTag:     {provenance_val['dict']:>8,.0f} records/sec")
+    print(f"PTagSeries (minimal):  {minimal_series_val['dict']:>8,.0f} records/sec")
+    print(f"PTagSeries (complex):  {complex_series_val['dict']:>8,.0f} records/sec")
+
+    print("\n  VALIDATION PERFORMANCE (validate_json)")
+    print(f"PTag:     {provenance_val['json']:>8,.0f} records/sec")
+    print(f"PTagSeries (minimal):  {minimal_series_val['json']:>8,.0f} records/sec")
+    print(f"PTagSeries (complex):  {complex_series_val['json']:>8,.0f} records/sec")
 
     print("\n  SERIALIZATION PERFORMANCE (Pydantic JSON)")
     print(f"PTag:     {provenance_ser['pydantic']:>8,.0f} records/sec")
@@ -403,9 +554,12 @@ def main():
     print(f"PTagSeries (complex):  {complex_mem:>8,.0f} bytes")
 
     _write_text_summary(
-        ptag_rps=provenance_rps,
-        series_min_rps=minimal_series_rps,
-        series_complex_rps=complex_series_rps,
+        ptag_rps=provenance_val["dict"],
+        series_min_rps=minimal_series_val["dict"],
+        series_complex_rps=complex_series_val["dict"],
+        ptag_json_rps=provenance_val["json"],
+        series_min_json_rps=minimal_series_val["json"],
+        series_complex_json_rps=complex_series_val["json"],
         ptag_ser_pyd=provenance_ser["pydantic"],
         series_min_ser_pyd=minimal_ser["pydantic"],
         series_complex_ser_pyd=complex_ser["pydantic"],
@@ -420,12 +574,21 @@ def main():
     _write_markdown_summary(
         python_version=sys.version,
         has_orjson=has_orjson,
-        ptag_rps=provenance_rps,
-        series_min_rps=minimal_series_rps,
-        series_complex_rps=complex_series_rps,
+        ptag_rps=provenance_val["dict"],
+        series_min_rps=minimal_series_val["dict"],
+        series_complex_rps=complex_series_val["dict"],
+        ptag_json_rps=provenance_val["json"],
+        series_min_json_rps=minimal_series_val["json"],
+        series_complex_json_rps=complex_series_val["json"],
+        ptag_msgspec_rps=provenance_val.get("msgspec"),
+        series_min_msgspec_rps=minimal_series_val.get("msgspec"),
+        series_complex_msgspec_rps=complex_series_val.get("msgspec"),
         ptag_ser_pyd=provenance_ser["pydantic"],
         series_min_ser_pyd=minimal_ser["pydantic"],
         series_complex_ser_pyd=complex_ser["pydantic"],
+        ptag_ser_std=provenance_ser["stdlib_json"],
+        series_min_ser_std=minimal_ser["stdlib_json"],
+        series_complex_ser_std=complex_ser["stdlib_json"],
         ptag_ser_orj=provenance_ser.get("orjson"),
         series_min_ser_orj=minimal_ser.get("orjson"),
         series_complex_ser_orj=complex_ser.get("orjson"),
@@ -434,6 +597,13 @@ def main():
         series_complex_mem=complex_mem,
     )
 
+    _write_json_summary(
+        python_version=sys.version,
+        validation={name: rps for name, (rps, _) in validation.items()},
+        serialization=serialization,
+        memory=memory,
+    )
+
     print("\nBenchmark complete!")
 
 
@@ -7,27 +7,26 @@
 - Prints import origins to catch shadowed installs
 """
 
+from __future__ import annotations
+
+from functools import cache
+from itertools import chain
 import json
 import logging
 from pathlib import Path
+import re
 import sys
+from typing import TYPE_CHECKING
 
-from packaging.requirements import Requirement
-from packaging.version import Version
+if TYPE_CHECKING:
+    from packaging.requirements import Requirement
 
 # Prefer installed packages; fall back to repo src for dev
 REPO_ROOT = Path(__file__).resolve().parents[2]
 SRC_PATH = REPO_ROOT / "src"
 
-try:
-    from importlib.metadata import PackageNotFoundError, version
-except Exception:  # pragma: no cover
-    from importlib_metadata import PackageNotFoundError, version  # type: ignore
-
-try:
-    import tomllib  # py311+
-except Exception:  # pragma: no cover
-    import tomli as tomllib  # type: ignore
+# Project names compare case-insensitively with runs of "-", "_", "." treated as equal (PEP 503)
+SPEC_DEP_RX = re.compile(r"\s*civic[-_.]+transparency[-_.]+ptag[-_.]+spec(?![\w.-])", re.IGNORECASE)
 
 
 logger = logging.getLogger("check_version_compatibility")
@@ -35,35 +34,40 @@ if not logger.handlers:
     logging.basicConfig(level=logging.WARNING)
 
 
+@cache
 def _load_pyproject() -> dict:
+    import tomllib  # only needed here; keeps module import light
+
     p = REPO_ROOT / "pyproject.toml"
     with p.open("rb") as f:
         return tomllib.load(f)
 
 
-def _find_spec_requirement(pyproj: dict) -> Requirement | None:
-    # Search [project].dependencies first
-    for dep in pyproj.get("project", {}).get("dependencies", []):
-        try:
-            req = Requirement(dep)
-        except Exception as e:
-            logger.debug("Skipping dependency %r while parsing Requirement: %s", dep, e)
+@cache
+def _find_spec_requirement() -> Requirement | None:
+    from packaging.requirements import Requirement
+
+    project = _load_pyproject().get("project", {})
+    # Search [project].dependencies first, then allow a pinned dev override in optional deps
+    deps = chain(
+        project.get("dependencies", []),
+        project.get("optional-dependencies", {}).get("dev", []),
+    )
+    for dep in deps:
+        # Cheap name match first; only the spec entry is parsed into a Requirement
+        if not SPEC_DEP_RX.match(dep):
             continue
-        if req.name == "civic-transparency-ptag-spec":
-            return req
-    # Also allow a pinned dev override in optional deps
-    for dep in pyproj.get("project", {}).get("optional-dependencies", {}).get("dev", []):
         try:
-            req = Requirement(dep)
+            return Requirement(dep)
         except Exception as e:
-            logger.debug("Skipping dev dependency %r while parsing Requirement: %s", dep, e)
-            continue
-        if req.name == "civic-transparency-ptag-spec":
-            return req
+            logger.debug("Skipping dependency %r while parsing Requirement: %s", dep, e)
     return None
 
 
+@cache
 def _get_installed(name: str) -> str | None:
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version(name)
     except PackageNotFoundError:
@@ -113,10 +117,11 @@ def _assert_types_points_default_factory() -> None:
 
 def main() -> int:
     """Check compatibility between installed civic-transparency-ptag-spec and project requirements, and verify schema/type invariants."""
+    from packaging.version import Version
+
     print("Checking civic-transparency types/spec compatibility…")
 
-    pyproj = _load_pyproject()
-    req = _find_spec_requirement(pyproj)
+    req = _find_spec_requirement()
     if not req:
         print("WARN: No civic-transparency-ptag-spec requirement found in pyproject.toml")
     else:
@@ -16,8 +16,13 @@ def get_coverage_summary() -> str | None:
         return None
 
     try:
-        tree = ET.parse(cov)
-        root = tree.getroot()
+        # Totals live on the root element; its attributes are complete at the
+        # first "start" event, so stop there instead of building the whole tree.
+        root = None
+        with cov.open("rb") as f:
+            for _event, elem in ET.iterparse(f, events=("start",)):
+                root = elem
+                break
         if root is None:
             print("coverage.xml is missing a root element.")
             return None
@@ -5,11 +5,18 @@ Intended to be run in CI (but testable locally).
 """
 
 import argparse
+import ast
+import atexit
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import cache
 import hashlib
 from importlib.metadata import version as pkgver
 from importlib.resources import as_file, files
 from importlib.resources.abc import Traversable
+import mmap
+import os
 from pathlib import Path
 import re
 import subprocess  # nosec: B404  (used with shell=False and fixed argv)
@@ -19,6 +26,10 @@ from typing import NamedTuple
 SCHEMA_PKG_ROOT = "ci.transparency.ptag.spec"  # schemas live under here
 DEFAULT_OUT_DIR = Path("src/ci/transparency/ptag/types")
 
+# Keeps as_file() extractions alive until exit (only matters for zipped installs)
+_RESOURCES = ExitStack()
+atexit.register(_RESOURCES.close)
+
 
 class SchemaPair(NamedTuple):
     """A pair of schema filenames for the PTag spec.
@@ -38,6 +49,7 @@ class SchemaPair(NamedTuple):
 # =================
 # Schema discovery & hashing
 # =================
+@cache
 def _schema_dir() -> Traversable:
     """Return a Traversable for the /schemas dir inside the spec package."""
     root = files(SCHEMA_PKG_ROOT)
@@ -47,6 +59,7 @@ def _schema_dir() -> Traversable:
     return files(f"{SCHEMA_PKG_ROOT}.schemas")
 
 
+@cache
 def _discover_schema_names() -> SchemaPair:
     """Pick actual schema filenames from the installed wheel."""
     sdir = _schema_dir()
@@ -76,13 +89,21 @@ def _discover_schema_names() -> SchemaPair:
     return SchemaPair(series=series, ptag=ptag)
 
 
-def _sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+def _sha256_file(path: Path) -> str:
+    """Hash the raw file bytes without decoding them to text first."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 
+@cache
+def _schema_path(schema_name: str) -> Path:
+    """Return a real filesystem path for a schema, materializing it at most once."""
+    return Path(_RESOURCES.enter_context(as_file(_schema_dir() / schema_name)))
 
-def _schema_sha(sdir: Traversable, schema_name: str) -> str:
-    with as_file(sdir / schema_name) as schema_path:
-        return _sha256_text(Path(schema_path).read_text(encoding="utf-8"))
+
+@cache
+def _schema_sha(schema_name: str) -> str:
+    return _sha256_file(_schema_path(schema_name))
 
 
 # =================
@@ -90,85 +111,136 @@ def _schema_sha(sdir: Traversable, schema_name: str) -> str:
 # =================
 def _normalize_line_endings(file_path: Path) -> None:
     """Convert CRLF -> LF to match formatting tools & stable hashing."""
+    # Scan through a read-only mapping first; on LF-only files (the usual case) we never
+    # copy the content into a bytes object or rewrite the file.
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b"\r\n") == -1:
+                return
     content = file_path.read_bytes()
-    if b"\r\n" in content:
-        file_path.write_bytes(content.replace(b"\r\n", b"\n"))
+    file_path.write_bytes(content.replace(b"\r\n", b"\n"))
 
 
-def _add_schema_header(py_file: Path, schema_name: str) -> None:
-    """Prepend a provenance header recognized by pre-commit checks."""
-    _normalize_line_endings(py_file)
-    sdir = _schema_dir()
-    schema_text = (sdir / schema_name).read_text(encoding="utf-8")
-    header = (
+def _schema_header(schema_name: str, schema_sha: str, spec_ver: str) -> str:
+    """Return the provenance header recognized by pre-commit checks."""
+    return (
         "# AUTO-GENERATED: do not edit by hand\n"
         f"# source-schema: {schema_name}\n"
-        f"# schema-sha256: {_sha256_text(schema_text)}\n"
-        f"# spec-version: {pkgver('civic-transparency-ptag-spec')}\n"
+        f"# schema-sha256: {schema_sha}\n"
+        f"# spec-version: {spec_ver}\n"
     )
-    py_text = py_file.read_text(encoding="utf-8")
-    py_file.write_text(header + py_text, encoding="utf-8")
-    _normalize_line_endings(py_file)
 
 
 # =================
 # Post-processing tweaks (safe / idempotent)
 # =================
-def _fix_points_field(series_file: Path) -> bool:
+_POINTS_ALREADY_OK_RX = re.compile(
+    r"""^[ \t]*points:\s*list\[PTagSeriesPoint\]\s*=\s*Field\(\s*default_factory\s*=\s*list\s*\)\s*(?:#\s*type:\s*ignore)?\s*$""",
+    re.MULTILINE,
+)
+_POINTS_FIELD_RX = re.compile(
+    r"""(?P<indent>^[ \t]*)points:\s*list\[PTagSeriesPoint\]\s*=\s*Field\([^)]*\)""",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+_POINTS_DECL = "points: list[PTagSeriesPoint] = Field("
+_POINTS_FIXED = "points: list[PTagSeriesPoint] = Field(default_factory=list)"
+
+
+def _fix_points_field(text: str) -> str:
     """Ensure: points: list[PTagSeriesPoint] = Field(default_factory=list).
 
     Works across formatting variations, and silences Pyright on this line.
+    Returns the (possibly) patched module text.
     """
-    text = series_file.read_text(encoding="utf-8")
-
-    # Already OK?
-    already_ok = re.search(
-        r"""^[ \t]*points:\s*list\[PTagSeriesPoint\]\s*=\s*Field\(\s*default_factory\s*=\s*list\s*\)\s*(?:#\s*type:\s*ignore)?\s*$""",
-        text,
-        re.MULTILINE,
-    )
-    if already_ok:
+    idx = text.find(_POINTS_DECL)
+    line_start = text.rfind("\n", 0, idx) + 1
+    at_line_start = idx != -1 and not text[line_start:idx].strip(" \t")
+
+    # Fast path: locate the declaration with plain str.find and judge only that slice
+    if at_line_start:
+        close = text.find(")", idx + len(_POINTS_DECL))
+        if close != -1:
+            # Whitespace-insensitive, so an already-fixed Field(...) split over lines counts too
+            if "default_factory=list" in "".join(text[idx:close].split()):
+                print(
+                    "[series] points Field already uses default_factory=list (with/without type: ignore) (skip patch)"
+                )
+                return text
+            print("[series] Patched points Field -> default_factory=list")
+            return f"{text[:idx]}{_POINTS_FIXED}  # type: ignore{text[close + 1 :]}"
+
+    # Otherwise fall back to the regexes
+    if _POINTS_ALREADY_OK_RX.search(text):
         print(
             "[series] points Field already uses default_factory=list (with/without type: ignore) (skip patch)"
         )
-        return False
+        return text
 
-    pattern = re.compile(
-        r"""(?P<indent>^[ \t]*)points:\s*list\[PTagSeriesPoint\]\s*=\s*Field\([^)]*\)""",
-        re.MULTILINE | re.DOTALL,
-    )
     replacement = (
         r"\g<indent>points: list[PTagSeriesPoint] = Field(default_factory=list)  # type: ignore"
     )
 
-    if not pattern.search(text):
+    if not _POINTS_FIELD_RX.search(text):
         print("[series] points Field pattern not found (skip patch)")
-        return False
+        return text
 
-    text2 = pattern.sub(replacement, text, count=1)
-    series_file.write_text(text2, encoding="utf-8")
-    _normalize_line_endings(series_file)
     print("[series] Patched points Field -> default_factory=list")
-    return True
+    return _POINTS_FIELD_RX.sub(replacement, text, count=1)
+
+
+def _post_process(py_file: Path, header: str, *, fix_points: bool = False) -> None:
+    """Apply all edits to a freshly generated module with one read and one write.
+
+    Normalizes CRLF -> LF, optionally patches the points field, and prepends the header.
+    Works on bytes so the written file has LF endings on every platform.
+    """
+    text = py_file.read_bytes().replace(b"\r\n", b"\n").decode("utf-8")
+    if fix_points:
+        text = _fix_points_field(text)
+    py_file.write_bytes((header + text).encode("utf-8"))
 
 
 # =================
 # Code generation
 # =================
-def _format_with_ruff(py_file: Path) -> None:
-    """Run ruff format and fix on generated file."""
-    import subprocess  # nosec: B404
+def _ruff_cmd() -> list[str]:
+    """Return the argv prefix for the ruff installed with the running interpreter.
+
+    Never a ruff found on PATH: it may be a different version, and the generated files
+    are drift-checked byte for byte. Prefer the binary directly, since `python -m ruff`
+    costs an extra interpreter start.
+    """
+    try:
+        from ruff.__main__ import find_ruff_bin
+
+        return [os.fsdecode(find_ruff_bin())]
+    except (ImportError, FileNotFoundError):
+        pass
+    exe = Path(sys.executable).with_name("ruff.exe" if os.name == "nt" else "ruff")
+    if exe.is_file():
+        return [str(exe)]
+    return [sys.executable, "-m", "ruff"]
+
+
+def _format_with_ruff(py_files: Iterable[Path]) -> None:
+    """Run ruff format and fix on generated files (one invocation each for all files)."""
+    paths = [str(p) for p in py_files]
+    ruff = _ruff_cmd()
 
     # Format (fixes quotes, line length, etc.)
     subprocess.run(  # noqa: S603  # nosec: B603  (shell disabled; args are static)
-        [sys.executable, "-m", "ruff", "format", str(py_file)],
+        [*ruff, "format", *paths],
         check=False,  # Don't fail if ruff isn't installed
         capture_output=True,
     )
 
     # Auto-fix (fixes some violations like quote style)
     subprocess.run(  # noqa: S603  # nosec: B603  (shell disabled; args are static)
-        [sys.executable, "-m", "ruff", "check", "--fix", str(py_file)],
+        [*ruff, "check", "--fix", *paths],
         check=False,
         capture_output=True,
     )
@@ -203,12 +275,17 @@ def _run_dcg(schema_path: Path, output_file: Path) -> None:
 # =================
 # Public symbol resolution & __init__ authoring
 # =================
-_CLASS_DEF_RX = re.compile(r"^[ \t]*class[ \t]+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\(", re.MULTILINE)
+def _classes_in_file(py_file: Path) -> frozenset[str]:
+    """Return the names of top-level classes defined in a generated module."""
+    st = py_file.stat()
+    # Keyed on size/mtime so a regenerated file is re-parsed, an unchanged one is not
+    return _parse_class_names(py_file, st.st_size, st.st_mtime_ns)
 
 
-def _classes_in_file(py_file: Path) -> set[str]:
-    text = py_file.read_text(encoding="utf-8")
-    return {m.group("name") for m in _CLASS_DEF_RX.finditer(text)}
+@cache
+def _parse_class_names(py_file: Path, size: int, mtime_ns: int) -> frozenset[str]:
+    tree = ast.parse(py_file.read_text(encoding="utf-8"), filename=str(py_file))
+    return frozenset(node.name for node in tree.body if isinstance(node, ast.ClassDef))
 
 
 def _resolve_symbols(series_py: Path, ptag_py: Path) -> tuple[str, str, str]:
@@ -236,10 +313,9 @@ def _resolve_symbols(series_py: Path, ptag_py: Path) -> tuple[str, str, str]:
     return "PTag", "PTagSeries", "PTagInterval"
 
 
-def _write_meta_py(out_dir: Path, schema_shas: dict[str, str]) -> None:
+def _write_meta_py(out_dir: Path, schema_shas: dict[str, str], spec_ver: str) -> None:
     """Write _meta.py with the spec version and schema hashes."""
     meta = out_dir / "_meta.py"
-    spec_ver = pkgver("civic-transparency-ptag-spec")
     lines = [
         f'PTAG_SPEC_VERSION = "{spec_ver}"',
         "SCHEMA_HASHES = {",
@@ -258,9 +334,16 @@ def _write_init_py(
     interval_cls: str,
     ptag_cls: str,
 ) -> None:
-    """Write a minimal __init__ that exposes PTag, PTagSeries, and PTagInterval."""
+    """Write a minimal __init__ that exposes PTag, PTagSeries, and PTagInterval.
+
+    ``__version__`` is resolved lazily (PEP 562) so importing the package skips the
+    ``version()`` metadata lookup until someone asks for it. The module ``__getattr__`` is
+    hidden from type checkers, which see only ``__version__: str``, so unknown names still
+    fail to type-check. It is not baked in as a literal:
+    the generated files are checked for drift, and a literal would change with every build.
+    """
     lines: list[str] = [
-        "from importlib.metadata import version as _pkgver",
+        "from typing import TYPE_CHECKING",
         "",
         f"from .ptag import {ptag_cls} as PTag",
         f"from .ptag_series import {interval_cls} as PTagInterval",
@@ -268,11 +351,23 @@ def _write_init_py(
         "",
         '__all__ = ["PTag", "PTagSeries", "PTagInterval"]',
         "",
-        "# Package version",
-        "try:",
-        '    __version__ = _pkgver("civic-transparency-py-ptag-types")',
-        "except Exception:",
-        '    __version__ = "0.0.0+unknown"',
+        "",
+        "# Package version (looked up on first access, then cached as a module global)",
+        "if TYPE_CHECKING:",
+        "    __version__: str",
+        "else:",
+        "",
+        "    def __getattr__(name: str) -> str:",
+        '        if name != "__version__":',
+        '            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+        "        from importlib.metadata import version",
+        "",
+        "        try:",
+        '            value = version("civic-transparency-ptag-types")',
+        "        except Exception:",
+        '            value = "0.0.0+unknown"',
+        "        globals()[name] = value",
+        "        return value",
         "",
     ]
     init_py = out_dir / "__init__.py"
@@ -289,10 +384,11 @@ def _discover_exports(py_paths: Iterable[Path]) -> tuple[list[str], list[str]]:
     exports: list[str] = []
     imports: list[str] = []
     for p in py_paths:
-        txt = p.read_text(encoding="utf-8")
+        # Same cached parse _resolve_symbols used, so no file is read again here
+        classes = _classes_in_file(p)
         mod = p.stem
         for cls in ("PTagSeries", "PTagInterval", "PTag"):
-            if f"class {cls}(" in txt:
+            if cls in classes:
                 exports.append(cls)
                 imports.append(f"from .{mod} import {cls}")
     return exports, imports
@@ -312,6 +408,9 @@ def generate_all(out_dir: Path = DEFAULT_OUT_DIR) -> None:
             present = []
         raise RuntimeError(f"Schema discovery failed: {e}\nPresent files: {present}") from e
 
+    # Looked up once; every header and _meta.py record the same spec version
+    spec_ver = pkgver("civic-transparency-ptag-spec")
+
     plan = [
         (schemas.series, "ptag_series.py"),
         (schemas.ptag, "ptag.py"),
@@ -320,22 +419,32 @@ def generate_all(out_dir: Path = DEFAULT_OUT_DIR) -> None:
     generated: list[Path] = []
     schema_shas: dict[str, str] = {}
 
+    def _generate(item: tuple[str, str]) -> Path:
+        schema_name, py_name = item
+        target = out_dir / py_name
+        _run_dcg(_schema_path(schema_name), target)
+        return target
+
     for schema_name, py_name in plan:
-        schema_res = sdir / schema_name
-        print(f"  - {py_name} from {schema_name} [{schema_res}]")
-        with as_file(schema_res) as schema_path:
-            target = out_dir / py_name
-            _run_dcg(schema_path, target)
-            _normalize_line_endings(target)
-            _format_with_ruff(target)
-        schema_shas[schema_name] = _schema_sha(sdir, schema_name)
-
-        if py_name == "ptag_series.py" and _fix_points_field(out_dir / py_name):
-            _format_with_ruff(out_dir / py_name)
-
-        _add_schema_header(out_dir / py_name, schema_name)
-        _format_with_ruff(out_dir / py_name)
-        generated.append(out_dir / py_name)
+        print(f"  - {py_name} from {schema_name} [{sdir / schema_name}]")
+        # Hash each schema once; the digest feeds both the header and _meta.py
+        schema_shas[schema_name] = _schema_sha(schema_name)
+
+    # Each dcg run is its own interpreter process, so threads overlap them fully
+    with ThreadPoolExecutor(max_workers=len(plan)) as ex:
+        targets = list(ex.map(_generate, plan))
+
+    for (schema_name, py_name), target in zip(plan, targets, strict=True):
+        _post_process(
+            target,
+            _schema_header(schema_name, schema_shas[schema_name], spec_ver),
+            fix_points=py_name == "ptag_series.py",
+        )
+        generated.append(target)
+
+    # Format the generated models once, after all in-place edits
+    # (_meta.py and __init__.py are written already formatted)
+    _format_with_ruff(generated)
 
     # Resolve concrete class names and enforce Interval presence
     series_py = out_dir / "ptag_series.py"
@@ -343,7 +452,7 @@ def generate_all(out_dir: Path = DEFAULT_OUT_DIR) -> None:
     ptag_cls, series_cls, interval_cls = _resolve_symbols(series_py, ptag_py)
 
     # Write metadata + top-level API
-    _write_meta_py(out_dir, schema_shas)
+    _write_meta_py(out_dir, schema_shas, spec_ver)
     _write_init_py(out_dir, series_cls=series_cls, interval_cls=interval_cls, ptag_cls=ptag_cls)
 
     # (Optional) debug: show discovered classes
@@ -12,6 +12,19 @@ import zipfile
 DIST = Path("dist")
 
 
+def _bucket_entries(z: zipfile.ZipFile) -> tuple[list[str], list[str]]:
+    """Return (schemas, openapis) from one pass over the wheel's central directory."""
+    schemas: list[str] = []
+    openapis: list[str] = []
+    for info in z.infolist():
+        name = info.filename
+        if name.endswith(".schema.json"):
+            schemas.append(name)
+        elif name.endswith(".openapi.yaml"):
+            openapis.append(name)
+    return schemas, openapis
+
+
 def main() -> int:
     """List and inspect build artifacts in the dist/ directory.
 
@@ -46,9 +59,7 @@ def main() -> int:
     # Inspect wheels for schema & OpenAPI files (informational; not failing)
     for whl in wheels:
         with zipfile.ZipFile(whl) as z:
-            names = z.namelist()
-            schemas = [n for n in names if n.endswith(".schema.json")]
-            openapis = [n for n in names if n.endswith(".openapi.yaml")]
+            schemas, openapis = _bucket_entries(z)
             print(f"\n{whl.name}")
             print("   JSON Schemas:")
             for s in schemas or ["(none found)"]:
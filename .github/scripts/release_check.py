@@ -6,7 +6,8 @@ What it does:
      SETUPTOOLS_SCM_PRETEND_VERSION=<plain>.
   2) Run "uv build" to create dist/*.
   3) Verify the wheel filename version == tag's plain version.
-  4) (optional) Regenerate types to a temp dir and diff with committed files.
+  4) (optional) Regenerate types to a temp dir (alongside the build) and diff
+     with committed files.
   5) (optional) Run tests: "uv run -m pytest -q".
   6) List artifacts and exit(0) if all checks pass.
 
@@ -19,7 +20,8 @@ Usage (CI):
 """
 
 import argparse
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import filecmp
 import os
 from pathlib import Path
 import re
@@ -36,6 +38,7 @@ TYPES_DIR = REPO_ROOT / "src" / "ci" / "transparency" / "ptag" / "types"
 GEN_SCRIPT = REPO_ROOT / ".github" / "scripts" / "generate_types.py"
 
 WHEEL_NAME_RX = re.compile(r"civic[_-]transparency[_-]types-([0-9][^-]*)-py", re.IGNORECASE)
+VERSION_RX = re.compile(r"\d+\.\d+\.\d+[0-9A-Za-z\.\-\+]*")
 
 
 def _run(cmd: list[str], *, env: dict[str, str] | None = None, cwd: Path | None = None) -> None:
@@ -46,12 +49,20 @@ def _run(cmd: list[str], *, env: dict[str, str] | None = None, cwd: Path | None
         raise SystemExit(cp.returncode)
 
 
-def _sha256_file(p: Path) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def _start(
+    cmd: list[str], *, env: dict[str, str] | None = None, cwd: Path | None = None
+) -> subprocess.Popen[bytes]:
+    """Launch a subprocess with shell disabled without waiting; pair with _wait()."""
+    print(f"+ {' '.join(cmd)}")
+    return subprocess.Popen(cmd, cwd=str(cwd) if cwd else None, env=env, shell=False)  # noqa: S603 # nosec B603 - args are static/validated; shell=False; no untrusted input
+
+
+def _wait(*procs: subprocess.Popen[bytes]) -> None:
+    """Wait for every process, then fail with the first nonzero exit code."""
+    codes = [p.wait() for p in procs]
+    for rc in codes:
+        if rc != 0:
+            raise SystemExit(rc)
 
 
 def _list_artifacts() -> None:
@@ -79,50 +90,82 @@ def _normalize_tag(tag: str) -> tuple[str, str]:
     """Return (raw_tag, plain_version) where plain drops a leading 'v' if present."""
     raw = tag.strip()
     plain = raw[1:] if raw.startswith("v") else raw
-    if not re.fullmatch(r"\d+\.\d+\.\d+[0-9A-Za-z\.\-\+]*", plain):
+    if not VERSION_RX.fullmatch(plain):
         raise SystemExit(f"ERROR: tag '{tag}' doesn't look like a version (got '{plain}')")
     return raw, plain
 
 
+def _walk_files(root: Path) -> dict[Path, tuple[Path, os.stat_result]]:
+    """Map each file under root (relative path) to its absolute path and stat result.
+
+    Uses os.scandir so the file-type check comes from the directory entry itself
+    rather than a separate stat() per path.
+    """
+    found: dict[Path, tuple[Path, os.stat_result]] = {}
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    p = Path(entry.path)
+                    found[p.relative_to(root)] = (p, entry.stat())
+    return found
+
+
 def _compare_dirs(a: Path, b: Path) -> list[str]:
     """Return a list of human-readable diffs; empty list means identical."""
     diffs: list[str] = []
-    a_files = {p.relative_to(a): p for p in a.rglob("*") if p.is_file()}
-    b_files = {p.relative_to(b): p for p in b.rglob("*") if p.is_file()}
-
-    missing_in_b = sorted(set(a_files) - set(b_files))
-    missing_in_a = sorted(set(b_files) - set(a_files))
+    # Keep each file's stat so sizes can be compared without touching the file again
+    a_files = _walk_files(a)
+    b_files = _walk_files(b)
+
+    # dict key views are set-like; build each difference once, sort only what gets printed
+    missing_in_b = a_files.keys() - b_files.keys()
+    missing_in_a = b_files.keys() - a_files.keys()
+    common = a_files.keys() & b_files.keys()
     if missing_in_b:
-        diffs.append(f"Missing in committed types: {', '.join(str(x) for x in missing_in_b)}")
+        diffs.append(f"Missing in committed types: {', '.join(map(str, sorted(missing_in_b)))}")
     if missing_in_a:
-        diffs.append(f"Extra files in committed types: {', '.join(str(x) for x in missing_in_a)}")
-
-    for rel in sorted(set(a_files) & set(b_files)):
-        if _sha256_file(a_files[rel]) != _sha256_file(b_files[rel]):
-            diffs.append(f"Content differs: {rel}")
+        diffs.append(f"Extra files in committed types: {', '.join(map(str, sorted(missing_in_a)))}")
+
+    # Different sizes can never compare equal; only same-size files need reading
+    same_size = [rel for rel in common if a_files[rel][1].st_size == b_files[rel][1].st_size]
+
+    # Equality is all we need: compare bytes block by block (stops at the first
+    # mismatching block, no hashing), with the file reads overlapped on a thread pool
+    filecmp.clear_cache()
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+        same = {
+            rel: ex.submit(filecmp.cmp, a_files[rel][0], b_files[rel][0], shallow=False)
+            for rel in same_size
+        }
+        for rel in sorted(common):
+            if rel not in same:
+                diffs.append(f"Content differs (size): {rel}")
+            elif not same[rel].result():
+                diffs.append(f"Content differs: {rel}")
     return diffs
 
 
-def ensure_types_no_drift() -> None:
-    """Regenerate to a temp dir and diff vs committed TYPES_DIR."""
-    if not GEN_SCRIPT.exists():
-        raise SystemExit(f"ERROR: generator not found: {GEN_SCRIPT}")
+def _start_regenerate(out: Path) -> subprocess.Popen[bytes]:
+    """Start regenerating types into out (a scratch dir)."""
+    print(f"Regenerating types into: {out}")
+    return _start([sys.executable, str(GEN_SCRIPT), "--out", str(out)])
 
-    with tempfile.TemporaryDirectory() as tmp:
-        out = Path(tmp)
-        print(f"Regenerating types into: {out}")
-        _run([sys.executable, str(GEN_SCRIPT), "--out", str(out)])
-        print("Comparing regenerated vs committed…")
-        diffs = _compare_dirs(out, TYPES_DIR)
-        if diffs:
-            print(
-                "\nERROR: generated types differ from committed files:\n  - " + "\n  - ".join(diffs)
-            )
-            print(
-                "\nFix locally:\n  uv run python .github/scripts/generate_types.py\n  git add src/ci/transparency/ptag/types"
-            )
-            raise SystemExit(1)
-        print("OK: generated types match committed files.")
+
+def _check_types_drift(out: Path) -> None:
+    """Diff regenerated types in out vs committed TYPES_DIR; exit 1 on drift."""
+    print("Comparing regenerated vs committed…")
+    diffs = _compare_dirs(out, TYPES_DIR)
+    if diffs:
+        print("\nERROR: generated types differ from committed files:\n  - " + "\n  - ".join(diffs))
+        print(
+            "\nFix locally:\n  uv run python .github/scripts/generate_types.py\n  git add src/ci/transparency/ptag/types"
+        )
+        raise SystemExit(1)
+    print("OK: generated types match committed files.")
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -147,6 +190,10 @@ def main(argv: list[str] | None = None) -> int:
     raw_tag, plain = _normalize_tag(args.tag)
     print(f"Tag: {raw_tag}  → version: {plain}")
 
+    # Fail before anything is launched, so no build is left running on this exit
+    if args.ensure_types and not GEN_SCRIPT.exists():
+        raise SystemExit(f"ERROR: generator not found: {GEN_SCRIPT}")
+
     # Clean dist/ for a deterministic build
     if DIST_DIR.exists():
         shutil.rmtree(DIST_DIR)
@@ -154,18 +201,24 @@ def main(argv: list[str] | None = None) -> int:
     # Build with pinned version from tag
     env = os.environ.copy()
     env["SETUPTOOLS_SCM_PRETEND_VERSION"] = plain
-    _run(["uv", "build"], env=env, cwd=REPO_ROOT)
-
-    # Version sanity check
-    have = _wheel_version()
-    if have != plain:
-        print(f"ERROR: wheel version ({have}) != tag version ({plain})")
-        return 1
-    print(f"OK: wheel version matches tag ({have})")
-
-    # Optional: types drift check
-    if args.ensure_types:
-        ensure_types_no_drift()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The build and the optional regeneration share no state, so run them side by side
+        procs = [_start(["uv", "build"], env=env, cwd=REPO_ROOT)]
+        if args.ensure_types:
+            procs.append(_start_regenerate(Path(tmp)))
+        _wait(*procs)
+
+        # Version sanity check
+        have = _wheel_version()
+        if have != plain:
+            print(f"ERROR: wheel version ({have}) != tag version ({plain})")
+            return 1
+        print(f"OK: wheel version matches tag ({have})")
+
+        # Optional: types drift check
+        if args.ensure_types:
+            _check_types_drift(Path(tmp))
 
     # Optional: tests
     if args.run_tests:
@@ -1,4 +1,4 @@
-from importlib.metadata import version as _pkgver
+from typing import TYPE_CHECKING
 
 from .ptag import PTag as PTag
 from .ptag_series import PTagInterval as PTagInterval
@@ -6,8 +6,20 @@ from .ptag_series import PTagSeries as PTagSeries
 
 __all__ = ["PTag", "PTagSeries", "PTagInterval"]
 
-# Package version
-try:
-    __version__ = _pkgver("civic-transparency-py-ptag-types")
-except Exception:
-    __version__ = "0.0.0+unknown"
+
+# Package version (looked up on first access, then cached as a module global)
+if TYPE_CHECKING:
+    __version__: str
+else:
+
+    def __getattr__(name: str) -> str:
+        if name != "__version__":
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        from importlib.metadata import version
+
+        try:
+            value = version("civic-transparency-ptag-types")
+        except Exception:
+            value = "0.0.0+unknown"
+        globals()[name] = value
+        return value
@@ -1,10 +1,56 @@
 # tests/test_codegen_unit.py
 from pathlib import Path
-from generate_types import generate_all
-
-def test_generate_to_tmp(tmp_path: Path):
-    out = tmp_path / "generated"
-    generate_all(out_dir=out)  # Fixed: was output_dir, should be out_dir
-    assert out.exists()
-    assert (out / "ptag.py").exists()
-    assert (out / "ptag_series.py").exists()
+
+from generate_types import _fix_points_field, generate_all  # pyright: ignore[reportPrivateUsage]
+import pytest
+
+
+@pytest.fixture(scope="session")
+def generated(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run the generator once per session; generator-dependent tests share the output."""
+    out = tmp_path_factory.mktemp("generated")
+    generate_all(out_dir=out)
+    return out
+
+
+def test_generate_to_tmp(generated: Path):
+    assert generated.exists()
+    assert (generated / "ptag.py").exists()
+    assert (generated / "ptag_series.py").exists()
+
+
+# _fix_points_field: string-splicing fast path and its skip cases
+DCG_POINTS = """class PTagSeries(BaseModel):
+    points: list[PTagSeriesPoint] = Field(
+        ..., description='Time-ordered list of per-interval aggregates.', min_length=0
+    )
+"""
+FIXED_LINE = "    points: list[PTagSeriesPoint] = Field(default_factory=list)  # type: ignore\n"
+
+
+def test_fix_points_patches_dcg_multiline_output():
+    assert _fix_points_field(DCG_POINTS) == "class PTagSeries(BaseModel):\n" + FIXED_LINE
+
+
+def test_fix_points_skips_already_fixed_single_line():
+    text = "class PTagSeries(BaseModel):\n" + FIXED_LINE
+    assert _fix_points_field(text) == text
+
+
+def test_fix_points_skips_already_fixed_multiline():
+    text = """class PTagSeries(BaseModel):
+    points: list[PTagSeriesPoint] = Field(
+        default_factory=list
+    )
+"""
+    assert _fix_points_field(text) == text
+
+
+def test_fix_points_leaves_text_without_declaration():
+    text = "class PTag(BaseModel):\n    acct_type: str\n"
+    assert _fix_points_field(text) == text
+
+
+def test_fix_points_falls_back_to_regex_for_spacing_variants():
+    text = DCG_POINTS.replace("] = Field(", "]  =  Field(")
+    assert _fix_points_field(text) == "class PTagSeries(BaseModel):\n" + FIXED_LINE
@@ -1,27 +1,90 @@
 # tests/test_example_data.py
+from functools import cache
 from importlib.resources import files
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from ci.transparency.ptag.types import PTagSeries, PTag
 import pytest
 # pyright: reportGeneralTypeIssues=false, reportUnknownMemberType=false
 
+try:
+    from orjson import loads as _loads  # parses raw bytes in C
+except ImportError:
+    _loads = json.loads  # also accepts bytes
+
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+    from referencing import Registry
+
 # Access schemas using string path (no import needed)
 schema_dir = files("ci.transparency.ptag.spec.schemas")
-ptag_json = schema_dir.joinpath("ptag.schema.json").read_text(encoding="utf-8")
-ptag_series_json = schema_dir.joinpath("ptag_series.schema.json").read_text(encoding="utf-8")
+
+
+@cache
+def _schema(name: str) -> dict[str, Any]:
+    """Parse a spec schema once per test session."""
+    return _loads(schema_dir.joinpath(name).read_bytes())
+
+
+@cache
+def _registry() -> "Registry[Any]":
+    """Registry holding both spec schemas so cross-file $refs resolve."""
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT202012
+
+    return Registry().with_resources(  # type: ignore
+        (name, Resource.from_contents(_schema(name), default_specification=DRAFT202012))
+        for name in ("ptag.schema.json", "ptag_series.schema.json")
+    )
+
+
+@cache
+def _validator(name: str) -> "Draft202012Validator":
+    """Build the Draft 2020-12 validator for a spec schema once per session."""
+    from jsonschema import Draft202012Validator
+
+    return Draft202012Validator(_schema(name), registry=_registry())
+
+
+DATA_DIR = Path(__file__).parent / "data"
+
+# Written to data/ptag_minimal.json if the file is missing
+PTAG_MINIMAL = {
+    "acct_age_bucket": "1-6m",
+    "acct_type": "person",
+    "automation_flag": "manual",
+    "post_kind": "original",
+    "client_family": "mobile",
+    "media_provenance": "hash_only",
+    "origin_hint": "US-CA",
+    "dedup_hash": "a1b2c3d4e5f6789a",
+}
+
+
+@pytest.fixture(scope="session")
+def series_minimal() -> dict[str, Any]:
+    """Parsed data/series_minimal.json, read once per session."""
+    return _loads((DATA_DIR / "series_minimal.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def ptag_minimal() -> dict[str, Any]:
+    """Parsed data/ptag_minimal.json (created if missing), read once per session."""
+    data_file = DATA_DIR / "ptag_minimal.json"
+    if not data_file.exists():
+        data_file.write_text(json.dumps(PTAG_MINIMAL, indent=2))
+    return _loads(data_file.read_bytes())
+
 
 class TestExampleData:
     """Test that our example data validates correctly."""
 
-    def test_series_minimal_example(self):
+    def test_series_minimal_example(self, series_minimal: dict[str, Any]):
         """Test minimal valid PTagSeries example."""
-        data_file = Path(__file__).parent / "data" / "series_minimal.json"
-        data = json.loads(data_file.read_text())
-
         # Should
         # validate without errors
-        series = PTagSeries.model_validate(data)
+        series = PTagSeries.model_validate(series_minimal)
 
         # Verify key properties
         assert series.topic == "#TestTopic"
@@ -34,27 +97,10 @@ class TestExampleData:
         series2 = PTagSeries.model_validate(serialized)
         assert series == series2
 
-    def test_ptag_minimal_example(self):
+    def test_ptag_minimal_example(self, ptag_minimal: dict[str, Any]):
         """Test minimal valid PTag example."""
-        data_file = Path(__file__).parent / "data" / "ptag_minimal.json"
-        if not data_file.exists():
-            # Create the test data if it doesn't exist
-            test_data = {
-                "acct_age_bucket": "1-6m",
-                "acct_type": "person",
-                "automation_flag": "manual",
-                "post_kind": "original",
-                "client_family": "mobile",
-                "media_provenance": "hash_only",
-                "origin_hint": "US-CA",
-                "dedup_hash": "a1b2c3d4e5f6789a",
-            }
-            data_file.write_text(json.dumps(test_data, indent=2))
-
-        data = json.loads(data_file.read_text())
-
         # Should validate without errors
-        tag = PTag.model_validate(data)
+        tag = PTag.model_validate(ptag_minimal)
 
         # Verify key properties
         assert tag.acct_type.value == "person"  # Compare enum value
@@ -67,86 +113,19 @@ class TestExampleData:
         tag2 = PTag.model_validate(serialized)
         assert tag == tag2
 
-    def test_schema_validation_against_examples(self):
+    def test_schema_validation_against_examples(self, series_minimal: dict[str, Any], ptag_minimal: dict[str, Any]):
         """Validate examples against canonical JSON schemas."""
-        try:
-            from jsonschema import Draft202012Validator
-            from referencing import Registry, Resource
-            from referencing.jsonschema import DRAFT202012
-        except ImportError:
-            pytest.skip("jsonschema or referencing not available")
-
-        # Load schemas
-        schema_dir = files("ci.transparency.ptag.spec.schemas")
-
-        ptag_schema = json.loads(schema_dir.joinpath("ptag.schema.json").read_text())
-        ptag_series_schema = json.loads(schema_dir.joinpath("ptag_series.schema.json").read_text())
-
-        # Create registry with both schemas
-        from typing import Any, Tuple, List
-        resources: List[Tuple[str, Resource[Any]]] = [
-            ("ptag.schema.json", Resource.from_contents(ptag_schema, default_specification=DRAFT202012)),
-            ("ptag_series.schema.json", Resource.from_contents(ptag_series_schema, default_specification=DRAFT202012)),
-        ]
-        registry: Registry[Any] = Registry().with_resources(resources)  # type: ignore
+        pytest.importorskip("jsonschema")
+        pytest.importorskip("referencing")
 
         # Test PTagSeries
-        series_data_file = Path(__file__).parent / "data" / "series_minimal.json"
-        if series_data_file.exists():
-            series_data = json.loads(series_data_file.read_text())
-            try:
-                validator = Draft202012Validator(ptag_series_schema, registry=registry)
-                validator.validate(series_data)
-            except Exception as e:
-                pytest.skip(f"PTagSeries validation failed: {e}")
+        try:
+            _validator("ptag_series.schema.json").validate(series_minimal)
+        except Exception as e:
+            pytest.skip(f"PTagSeries validation failed: {e}")
 
         # Test PTag
-        tag_data_file = Path(__file__).parent / "data" / "ptag_minimal.json"
-        if tag_data_file.exists():
-            tag_data = json.loads(tag_data_file.read_text())
-            try:
-                validator = Draft202012Validator(ptag_schema, registry=registry)
-                validator.validate(tag_data)
-            except Exception as e:
-                pytest.skip(f"PTag validation failed: {e}")
-            """Validate examples against canonical JSON schemas."""
-            try:
-                from jsonschema import Draft202012Validator
-                from referencing import Registry, Resource
-                from referencing.jsonschema import DRAFT202012
-            except ImportError:
-                pytest.skip("jsonschema or referencing not available")
-
-            # Load schemas
-            schema_dir = files("ci.transparency.ptag.spec.schemas")
-
-            ptag_schema = json.loads(schema_dir.joinpath("ptag.schema.json").read_text())
-            ptag_series_schema = json.loads(schema_dir.joinpath("ptag_series.schema.json").read_text())
-
-            # Create registry with both schemas
-            from typing import Any, Tuple, List
-            resources: List[Tuple[str, Resource[Any]]] = [
-                ("ptag.schema.json", Resource.from_contents(ptag_schema, default_specification=DRAFT202012)),
-                ("ptag_series.schema.json", Resource.from_contents(ptag_series_schema, default_specification=DRAFT202012)),
-            ]
-            registry: Registry[Any] = Registry().with_resources(resources)  # type: ignore
-
-            # Test PTagSeries
-            series_data_file = Path(__file__).parent / "data" / "series_minimal.json"
-            if series_data_file.exists():
-                series_data = json.loads(series_data_file.read_text())
-                try:
-                    validator = Draft202012Validator(ptag_series_schema, registry=registry)
-                    validator.validate(series_data)
-                except Exception as e:
-                    pytest.skip(f"PTagSeries validation failed: {e}")
-
-            # Test PTag
-            tag_data_file = Path(__file__).parent / "data" / "ptag_minimal.json"
-            if tag_data_file.exists():
-                tag_data = json.loads(tag_data_file.read_text())
-                try:
-                    validator: Draft202012Validator = Draft202012Validator(ptag_schema, registry=registry)
-                    validator.validate(tag_data)
-                except Exception as e:
-                    pytest.skip(f"PTag validation failed: {e}")
+        try:
+            _validator("ptag.schema.json").validate(ptag_minimal)
+        except Exception as e:
+            pytest.skip(f"PTag validation failed: {e}")
@@ -0,0 +1,45 @@
+# tests/test_release_check.py
+from pathlib import Path
+
+from release_check import _compare_dirs  # pyright: ignore[reportPrivateUsage]
+
+
+def _tree(root: Path, files: dict[str, bytes]) -> Path:
+    for rel, data in files.items():
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(data)
+    return root
+
+
+BASE = {"__init__.py": b"x = 1\n", "ptag.py": b"class PTag: ...\n", "sub/ptag_series.py": b"s\n"}
+
+
+def test_compare_dirs_identical(tmp_path: Path):
+    a = _tree(tmp_path / "a", BASE)
+    b = _tree(tmp_path / "b", BASE)
+    assert _compare_dirs(a, b) == []
+
+
+def test_compare_dirs_missing_file(tmp_path: Path):
+    a = _tree(tmp_path / "a", BASE)
+    b = _tree(tmp_path / "b", {k: v for k, v in BASE.items() if k != "ptag.py"})
+    assert _compare_dirs(a, b) == ["Missing in committed types: ptag.py"]
+
+
+def test_compare_dirs_extra_file(tmp_path: Path):
+    a = _tree(tmp_path / "a", BASE)
+    b = _tree(tmp_path / "b", {**BASE, "sub/stale.py": b"old\n"})
+    assert _compare_dirs(a, b) == [f"Extra files in committed types: {Path('sub/stale.py')}"]
+
+
+def test_compare_dirs_size_difference(tmp_path: Path):
+    a = _tree(tmp_path / "a", BASE)
+    b = _tree(tmp_path / "b", {**BASE, "ptag.py": b"class PTag: pass\n\n"})
+    assert _compare_dirs(a, b) == ["Content differs (size): ptag.py"]
+
+
+def test_compare_dirs_same_size_different_content(tmp_path: Path):
+    a = _tree(tmp_path / "a", BASE)
+    b = _tree(tmp_path / "b", {**BASE, "__init__.py": b"x = 2\n"})
+    assert _compare_dirs(a, b) == ["Content differs: __init__.py"]
@@ -1,13 +1,7 @@
 # tests/test_series.py
-from importlib.resources import files
-
 from ci.transparency.ptag.types import PTagSeries
 from pydantic import BaseModel
 
-# Access schemas using string path (no import needed)
-schema_dir = files("ci.transparency.ptag.spec.schemas")
-ptag_series_json = schema_dir.joinpath("ptag_series.schema.json").read_text(encoding="utf-8")
-
 
 def test_series_model_schema_is_sane():
     assert issubclass(PTagSeries, BaseModel)